@@ -31,7 +31,8 @@ from .api.websocket import router as websocket_router
 
 # Import services
 from .services.monitoring_service import monitoring_service
-from .services.websocket_service import websocket_manager
+from .services.websocket_service import websocket_manager, per_message_deflate_enabled
+from .services.snmp_service import configure_event_loop
 
 # Configure logging
 logging.basicConfig(
@@ -334,12 +335,17 @@ if __name__ == "__main__":
     log_config["formatters"]["default"]["fmt"] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     log_config["formatters"]["access"]["fmt"] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Use uvloop where available (not on Windows); falls back to asyncio
+    loop = "uvloop" if configure_event_loop() else "asyncio"
+    
     # Run the application
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
         reload=debug,
+        loop=loop,
+        ws_per_message_deflate=per_message_deflate_enabled(),
         log_config=log_config,
         access_log=True
     )
\ No newline at end of file
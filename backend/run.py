@@ -17,13 +17,21 @@ os.chdir(backend_dir)
 
 if __name__ == "__main__":
     import uvicorn
+    from services.snmp_service import configure_event_loop
+    from services.websocket_service import per_message_deflate_enabled
     from main import app
     
+    # Use uvloop for the SNMP polling and WebSocket workload when available;
+    # uvloop is not available on Windows, where the default loop is kept
+    loop = "uvloop" if configure_event_loop() else "asyncio"
+    
     # Start the application
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8000,
         reload=False,
+        loop=loop,
+        ws_per_message_deflate=per_message_deflate_enabled(),
         log_level="info"
     )
\ No newline at end of file
@@ -2,6 +2,6 @@
 Services package for business logic.
 """
 
-from .snmp_service import SNMPService, ZTEOLTService
+from .snmp_service import SNMPService, ZTEOLTService, MultiDevicePoller, configure_event_loop
 from .monitoring_service import MonitoringService
 from .notification_service import NotificationService
\ No newline at end of file
@@ -384,8 +384,8 @@ class MonitoringService:
                     if not snmp_service:
                         continue
                     
-                    # Collect OLT performance data
-                    olt_info = await snmp_service.discover_olt()
+                    # Collect OLT performance data (live values, not cached)
+                    olt_info = await snmp_service.discover_olt(force_refresh=True)
                     if olt_info:
                         # Store CPU usage
                         cpu_data = PerformanceData(
@@ -436,7 +436,9 @@ class MonitoringService:
                     # Collect port performance data
                     ports = db.query(OLTPort).filter(OLTPort.olt_id == olt.id).all()
                     for port in ports:
-                        port_info = await snmp_service.get_port_info(port.slot_number, port.port_number)
+                        port_info = await snmp_service.get_port_info(
+                            port.slot_number, port.port_number, force_refresh=True
+                        )
                         if port_info:
                             # Store optical power data
                             rx_power_data = PerformanceData(
@@ -4,11 +4,16 @@ SNMP service for OLT communication.
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+import inspect
+import threading
+from typing import Dict, List, Optional, Tuple, Any, Union, Callable, AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import ipaddress
 
+import numpy as np
+
 try:
     from pysnmp.hlapi.asyncio import *
     from pysnmp.proto.rfc1902 import Integer, OctetString, Counter32, Counter64, Gauge32
@@ -24,18 +29,104 @@ except ImportError:
     class PySnmpError(Exception): pass
     Integer = OctetString = Counter32 = Counter64 = Gauge32 = object
 
+try:
+    import aiosnmp
+    from aiosnmp.exceptions import SnmpErrorTooBig
+except ImportError:
+    # Optional C-accelerated backend
+    aiosnmp = None
+    class SnmpErrorTooBig(Exception): pass
+
+try:
+    import uvloop
+except ImportError:
+    # Optional faster event loop (not available on Windows)
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# SNMP value constructors for set(), keyed by value_type
+_TYPE_CTORS: Dict[str, Callable[[Any], Any]] = {
+    "integer": Integer,
+    "string": OctetString,
+    "gauge": Gauge32
+}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _oid_tuple(oid: str) -> Tuple[int, ...]:
+    """Parse dotted OID string into a tuple of sub-identifiers."""
+    return tuple(int(x) for x in oid.split('.'))
+
+
+def ttl_cache(kind: str, bypass: Optional[Callable[[Any], bool]] = None):
+    """Cache coroutine results in the service's device cache.
+    
+    The cache key is built from ``kind`` and the bound call arguments, so
+    positional and keyword calls share entries.
+    Pass ``force_refresh=True`` to bypass the cache and re-poll the device.
+    ``bypass(self)`` returning True disables caching for that service.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            
+            if bypass is not None and bypass(self):
+                return await func(*bound.args, **bound.kwargs)
+            
+            key = (kind,) + tuple(bound.arguments.values())[1:]
+            if not force_refresh:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+            
+            result = await func(*bound.args, **bound.kwargs)
+            if result is not None:
+                self._cache_set(key, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def configure_event_loop() -> bool:
+    """Install uvloop as the asyncio event loop policy when available.
+    
+    Call before the event loop is created (e.g. before starting the
+    server). Returns True if uvloop was installed.
+    """
+    if uvloop is None:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
 
 @dataclass
 class SNMPConfig:
-    """SNMP configuration."""
+    """SNMP configuration.
+    
+    Polling throughput benefits from uvloop; see ``configure_event_loop``.
+    """
     host: str
     port: int = 161
     community: str = "public"
     version: str = "2c"
     timeout: int = 5
     retries: int = 3
+    max_inflight: int = 16  # Max concurrent requests to the agent
+    backend: str = "pysnmp"  # "pysnmp" or "aiosnmp"
+    track_deltas: bool = False  # Attach wrap-aware counter deltas to PortInfo
+    oid_batch_size: int = 32  # Max OIDs per GET PDU (halved automatically on tooBig)
+    bulk_max_repetitions: int = 32  # GETBULK max-repetitions for bulk walks
+    max_counter_rate: int = 2_500_000_000 // 8  # Max plausible counter increase per second (GPON line rate in bytes)
 
 
 @dataclass
@@ -75,6 +166,7 @@ class PortInfo:
     tx_packets: int
     rx_errors: int
     tx_errors: int
+    deltas: Optional[Dict[str, Optional[int]]] = None
 
 
 @dataclass
@@ -98,40 +190,306 @@ class ONTInfo:
     tx_packets: int
 
 
+def _tail1(oid: str) -> int:
+    """Parse the last sub-identifier of a dotted OID."""
+    return int(oid[oid.rfind('.') + 1:])
+
+
+def _tail2(oid: str) -> Tuple[int, int]:
+    """Parse the last two sub-identifiers of a dotted OID."""
+    j = oid.rfind('.')
+    i = oid.rfind('.', 0, j)
+    return int(oid[i + 1:j]), int(oid[j + 1:])
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    """Extract int from a pysnmp value via its native payload."""
+    if value is None:
+        return default
+    return int(getattr(value, "_value", value))
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    """Extract float from a pysnmp value via its native payload."""
+    if value is None:
+        return default
+    return float(getattr(value, "_value", value))
+
+
+def _as_str(value: Any, default: str = "") -> str:
+    """Extract str from a pysnmp value via its native payload."""
+    if value is None:
+        return default
+    raw = getattr(value, "_value", value)
+    if isinstance(raw, bytes):
+        return raw.decode(getattr(value, "encoding", "utf-8"), errors="replace")
+    return str(raw)
+
+
+def _int_column(column: Dict[Any, Any], keys: List[Any]) -> np.ndarray:
+    """Build int64 array from a column dict, aligned with keys."""
+    return np.fromiter((_as_int(column.get(key)) for key in keys), dtype=np.int64, count=len(keys))
+
+
+def _str_column(column: Dict[Any, Any], keys: List[Any]) -> np.ndarray:
+    """Build string array from a column dict, aligned with keys."""
+    return np.array([_as_str(column.get(key)) for key in keys], dtype=str)
+
+
+# ONT status names, indexed by ZTE status code
+_ONT_STATUS = ("unknown", "online", "offline", "dying_gasp", "los")
+_ONT_STATUS_NAMES = np.array(_ONT_STATUS)
+
+# Scale factors for raw analog readings, applied to a whole batch at once
+_PORT_SCALE = np.array([0.01, 0.01, 0.01, 0.001, 0.001], dtype=np.float32)  # tx, rx, temperature, voltage, bias
+_ONT_SCALE = np.array([0.01, 0.01, 0.001, 0.01], dtype=np.float32)  # rx, tx, voltage, temperature
+
+
+@functools.lru_cache(maxsize=4096)
+def _oid_obj(oid: Union[str, Tuple[int, ...]]) -> ObjectType:
+    """Get cached ObjectType for a read request.
+    
+    pysnmp resolves an ObjectType against the MIB once and skips the
+    lookup on later uses, so sharing instances is safe.
+    """
+    return ObjectType(ObjectIdentity(oid))
+
+
+@functools.lru_cache(maxsize=1024)
+def _oid_identity(oid: Union[str, Tuple[int, ...]]) -> ObjectIdentity:
+    """Get cached ObjectIdentity for a set request."""
+    return ObjectIdentity(oid)
+
+
+def _oid_str(oid: Union[str, Tuple[int, ...]]) -> str:
+    """Format OID as dotted string."""
+    return oid if isinstance(oid, str) else ".".join(map(str, oid))
+
+
+class AioSnmpBackend:
+    """aiosnmp transport for the SNMP hot path.
+    
+    aiosnmp encodes and decodes BER in C, which is considerably cheaper
+    than pysnmp for large GET/GETBULK responses. Results are returned as
+    ``(oid, value)`` pairs with OIDs in pysnmp's dotted form.
+    
+    One backend (and one UDP endpoint) is kept per device; use ``for_config``.
+    """
+    
+    # aiosnmp picks the SNMP type from the Python type; value types it
+    # cannot encode (e.g. Gauge32) are sent through pysnmp instead
+    TYPE_CTORS: Dict[str, Callable[[Any], Any]] = {
+        "integer": int,
+        "string": str
+    }
+    
+    _backends: Dict[Tuple, "AioSnmpBackend"] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, config: SNMPConfig):
+        self.config = config
+        self._snmp = None
+    
+    @classmethod
+    def for_config(cls, config: SNMPConfig) -> "AioSnmpBackend":
+        """Get the shared backend for device."""
+        key = _EnginePool.key(config)
+        with cls._lock:
+            backend = cls._backends.get(key)
+            if backend is None:
+                backend = cls._backends[key] = cls(config)
+            return backend
+    
+    def _client(self):
+        if self._snmp is None:
+            self._snmp = aiosnmp.Snmp(
+                host=self.config.host,
+                port=self.config.port,
+                community=self.config.community,
+                timeout=self.config.timeout,
+                retries=self.config.retries
+            )
+        return self._snmp
+    
+    def close(self):
+        """Close the UDP endpoint; the next request opens a new one."""
+        snmp, self._snmp = self._snmp, None
+        if snmp is not None:
+            snmp.close()
+    
+    @staticmethod
+    def _convert(var_bind) -> Tuple[str, Any]:
+        value = var_bind.value
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", errors="replace")
+        return var_bind.oid.lstrip("."), value
+    
+    async def get(self, oids: List[str]) -> List[Tuple[str, Any]]:
+        var_binds = await self._client().get(oids)
+        return [self._convert(vb) for vb in var_binds]
+    
+    async def walk(self, oid: str, max_repetitions: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """Walk subtree with GETNEXT, or GETBULK when ``max_repetitions`` is given."""
+        if max_repetitions is None:
+            var_binds = await self._client().walk(oid)
+        else:
+            var_binds = await self._client().bulk_walk(oid, max_repetitions=max_repetitions)
+        return [self._convert(vb) for vb in var_binds]
+    
+    async def set(self, oid: str, value: Any, value_type: str = "integer"):
+        await self._client().set([(oid, self.TYPE_CTORS[value_type](value))])
+
+
+class _EnginePool:
+    """Process-wide pool of SNMP engines and transports, one per device.
+    
+    Building an SnmpEngine and UdpTransportTarget is expensive, so services
+    created for the same device (e.g. per REST request) share them.
+    """
+    
+    _pools: Dict[Tuple, Tuple[Any, Any, Any]] = {}
+    _engines: Dict[Tuple, Any] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def key(config: SNMPConfig) -> Tuple:
+        return (config.host, config.port, config.community, config.timeout, config.retries)
+    
+    @classmethod
+    def get(cls, config: SNMPConfig, engine: Optional[Any] = None) -> Tuple[Any, Any, Any, Any]:
+        """Get (engine, community_data, transport_target, context_data) for device.
+        
+        A per-device engine is only built when no shared ``engine`` is given.
+        """
+        key = cls.key(config)
+        with cls._lock:
+            entry = cls._pools.get(key)
+            if entry is None:
+                entry = (
+                    CommunityData(config.community),
+                    UdpTransportTarget(
+                        (config.host, config.port),
+                        timeout=config.timeout,
+                        retries=config.retries
+                    ),
+                    ContextData()
+                )
+                cls._pools[key] = entry
+            
+            if engine is None:
+                engine = cls._engines.get(key)
+                if engine is None:
+                    engine = cls._engines[key] = SnmpEngine()
+            
+            return (engine,) + entry
+    
+    @classmethod
+    def evict(cls, config: SNMPConfig):
+        """Drop pooled entries for device."""
+        key = cls.key(config)
+        with cls._lock:
+            cls._pools.pop(key, None)
+            cls._engines.pop(key, None)
+
+
 class SNMPService:
     """Base SNMP service class."""
     
-    def __init__(self, config: SNMPConfig):
+    def __init__(self, config: SNMPConfig, engine: Optional[SnmpEngine] = None):
         self.config = config
-        self.engine = SnmpEngine()
+        self._shared_engine = engine
+        self._sem = asyncio.Semaphore(config.max_inflight)
+        self._aio_backend = None
+        self._counter_state: Dict[Tuple, Tuple[int, int]] = {}
+        self._learned_batch_size: int = config.oid_batch_size
+        self._batch_successes = 0
+        
+        if config.backend == "aiosnmp":
+            if aiosnmp is not None:
+                self._aio_backend = AioSnmpBackend.for_config(config)
+            else:
+                logger.warning("aiosnmp is not installed, falling back to pysnmp")
+        
         self._setup_snmp()
     
     def _setup_snmp(self):
-        """Setup SNMP engine and transport."""
+        """Setup SNMP engine and transport from the shared pool."""
         try:
-            self.community_data = CommunityData(self.config.community)
-            self.transport_target = UdpTransportTarget(
-                (self.config.host, self.config.port),
-                timeout=self.config.timeout,
-                retries=self.config.retries
-            )
-            self.context_data = ContextData()
+            (self.engine, self.community_data, self.transport_target,
+             self.context_data) = _EnginePool.get(self.config, self._shared_engine)
         except Exception as e:
             logger.error(f"Failed to setup SNMP: {e}")
             raise
     
+    def _reset_snmp(self, aio: Optional[bool] = None):
+        """Drop the failed transport after an error and rebuild it.
+        
+        ``aio`` selects the backend that failed; by default the configured one.
+        """
+        if aio is None:
+            aio = self._aio_backend is not None
+        if aio:
+            self._aio_backend.close()
+            return
+        
+        _EnginePool.evict(self.config)
+        try:
+            self._setup_snmp()
+        except Exception:
+            pass
+    
+    def _counter_delta(self, key: Tuple, value: Any, uptime: int) -> Optional[int]:
+        """Compute counter increase since the previous poll.
+        
+        ``uptime`` is the agent's sysUpTime (hundredths of a second) read in
+        the same request. A decrease is treated as a wrap for 32-bit
+        counters. Returns None on the first poll of a counter and whenever
+        the counter is discontinuous: the agent restarted (sysUpTime went
+        back), a 64-bit counter went back, or the increase is faster than
+        ``max_counter_rate`` allows.
+        """
+        raw = _as_int(value)
+        previous = self._counter_state.get(key)
+        self._counter_state[key] = (uptime, raw)
+        
+        if previous is None:
+            return None
+        
+        prev_uptime, prev_raw = previous
+        if uptime < prev_uptime:
+            return None
+        
+        if raw >= prev_raw:
+            delta = raw - prev_raw
+        elif type(value).__name__ == "Counter64" or prev_raw >= 2 ** 32:
+            return None
+        else:
+            delta = 2 ** 32 - prev_raw + raw
+        
+        elapsed = max(uptime - prev_uptime, 100) / 100
+        if delta > elapsed * self.config.max_counter_rate:
+            return None
+        
+        return delta
+    
     async def get(self, oid: str) -> Optional[Any]:
         """Get single SNMP value."""
         try:
-            iterator = getCmd(
-                self.engine,
-                self.community_data,
-                self.transport_target,
-                self.context_data,
-                ObjectType(ObjectIdentity(oid))
-            )
+            if self._aio_backend is not None:
+                async with self._sem:
+                    var_binds = await self._aio_backend.get([_oid_str(oid)])
+                return var_binds[0][1] if var_binds else None
             
-            error_indication, error_status, error_index, var_binds = await iterator
+            async with self._sem:
+                iterator = getCmd(
+                    self.engine,
+                    self.community_data,
+                    self.transport_target,
+                    self.context_data,
+                    _oid_obj(oid)
+                )
+                
+                error_indication, error_status, error_index, var_binds = await iterator
             
             if error_indication:
                 logger.error(f"SNMP error indication: {error_indication}")
@@ -146,15 +504,23 @@ class SNMPService:
             
         except Exception as e:
             logger.error(f"SNMP get error for OID {oid}: {e}")
+            self._reset_snmp()
             return None
     
-    async def get_bulk(self, oids: List[str]) -> Dict[str, Any]:
-        """Get multiple SNMP values."""
-        results = {}
+    async def _get_chunk(self, oids: List[Union[str, Tuple[int, ...]]]) -> Optional[List[Any]]:
+        """Get values for a single PDU; None if the agent replied tooBig."""
+        if self._aio_backend is not None:
+            try:
+                async with self._sem:
+                    var_binds = await self._aio_backend.get([_oid_str(oid) for oid in oids])
+            except SnmpErrorTooBig:
+                # aiosnmp raises on tooBig instead of returning an error status
+                return None
+            return [value for _, value in var_binds]
         
-        try:
-            object_types = [ObjectType(ObjectIdentity(oid)) for oid in oids]
-            
+        object_types = [_oid_obj(oid) for oid in oids]
+        
+        async with self._sem:
             iterator = getCmd(
                 self.engine,
                 self.community_data,
@@ -164,79 +530,160 @@ class SNMPService:
             )
             
             error_indication, error_status, error_index, var_binds = await iterator
-            
-            if error_indication:
-                logger.error(f"SNMP bulk error indication: {error_indication}")
-                return results
-            
-            if error_status:
-                logger.error(f"SNMP bulk error status: {error_status.prettyPrint()}")
-                return results
-            
-            for i, var_bind in enumerate(var_binds):
-                if i < len(oids):
-                    results[oids[i]] = var_bind[1]
+        
+        if error_indication:
+            logger.error(f"SNMP bulk error indication: {error_indication}")
+            return []
+        
+        if error_status:
+            if error_status.prettyPrint() == "tooBig":
+                return None
+            logger.error(f"SNMP bulk error status: {error_status.prettyPrint()}")
+            return []
+        
+        return [var_bind[1] for var_bind in var_binds[:len(oids)]]
+    
+    async def get_values(self, oids: List[Union[str, Tuple[int, ...]]]) -> List[Any]:
+        """Get multiple SNMP values in request order (empty list on error).
+        
+        OIDs are split into PDUs of the learned batch size, which is halved
+        whenever the agent replies tooBig and slowly grown back on success.
+        """
+        try:
+            while True:
+                size = self._learned_batch_size
+                chunks = [oids[i:i + size] for i in range(0, len(oids), size)]
+                results = await asyncio.gather(*(self._get_chunk(chunk) for chunk in chunks))
+                
+                if size > 1 and any(result is None for result in results):
+                    self._learned_batch_size = max(1, size // 2)
+                    self._batch_successes = 0
+                    logger.warning(
+                        f"SNMP agent {self.config.host} replied tooBig, "
+                        f"reducing batch size to {self._learned_batch_size}"
+                    )
+                    continue
+                
+                if not all(results):
+                    return []
+                
+                self._batch_successes += 1
+                if self._batch_successes >= 100 and self._learned_batch_size < self.config.oid_batch_size:
+                    self._learned_batch_size += 1
+                    self._batch_successes = 0
+                
+                return [value for result in results for value in result]
             
         except Exception as e:
             logger.error(f"SNMP bulk get error: {e}")
-        
-        return results
+            self._reset_snmp()
+            return []
     
-    async def walk(self, oid: str) -> Dict[str, Any]:
-        """Walk SNMP tree."""
-        results = {}
+    async def get_bulk(self, oids: List[Union[str, Tuple[int, ...]]]) -> Dict[Any, Any]:
+        """Get multiple SNMP values, keyed by the requested OIDs."""
+        return dict(zip(oids, await self.get_values(oids)))
+    
+    async def walk_stream(
+        self,
+        oid: str,
+        max_repetitions: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Walk SNMP tree, yielding (oid, value) rows as they arrive.
         
+        Uses GETNEXT by default, or GETBULK when ``max_repetitions`` is given.
+        """
         try:
-            iterator = nextCmd(
-                self.engine,
-                self.community_data,
-                self.transport_target,
-                self.context_data,
-                ObjectType(ObjectIdentity(oid)),
-                lexicographicMode=False
-            )
+            # Stop as soon as a row leaves the subtree, without
+            # waiting for the agent's end-of-subtree response
+            base = _oid_tuple(oid)
+            base_len = len(base)
             
-            async for error_indication, error_status, error_index, var_binds in iterator:
-                if error_indication:
-                    logger.error(f"SNMP walk error indication: {error_indication}")
-                    break
+            async with self._sem:
+                if self._aio_backend is not None:
+                    for oid_str, value in await self._aio_backend.walk(oid, max_repetitions):
+                        if _oid_tuple(oid_str)[:base_len] != base:
+                            return
+                        yield oid_str, value
+                    return
                 
-                if error_status:
-                    logger.error(f"SNMP walk error status: {error_status.prettyPrint()}")
-                    break
+                if max_repetitions is None:
+                    iterator = nextCmd(
+                        self.engine,
+                        self.community_data,
+                        self.transport_target,
+                        self.context_data,
+                        _oid_obj(oid),
+                        lexicographicMode=False
+                    )
+                else:
+                    iterator = bulkCmd(
+                        self.engine,
+                        self.community_data,
+                        self.transport_target,
+                        self.context_data,
+                        0,
+                        max_repetitions,
+                        _oid_obj(oid),
+                        lexicographicMode=False
+                    )
                 
-                for var_bind in var_binds:
-                    oid_str = str(var_bind[0])
-                    value = var_bind[1]
-                    results[oid_str] = value
+                async for error_indication, error_status, error_index, var_binds in iterator:
+                    if error_indication:
+                        logger.error(f"SNMP walk error indication: {error_indication}")
+                        break
+                    
+                    if error_status:
+                        logger.error(f"SNMP walk error status: {error_status.prettyPrint()}")
+                        break
+                    
+                    for var_bind in var_binds:
+                        if var_bind[0].asTuple()[:base_len] != base:
+                            return
+                        yield str(var_bind[0]), var_bind[1]
             
         except Exception as e:
             logger.error(f"SNMP walk error for OID {oid}: {e}")
+            self._reset_snmp()
+    
+    async def walk(self, oid: str) -> Dict[str, Any]:
+        """Walk SNMP tree."""
+        results = {}
+        async for oid_str, value in self.walk_stream(oid):
+            results[oid_str] = value
+        return results
+    
+    async def walk_bulk(self, oid: str, max_repetitions: Optional[int] = None) -> Dict[str, Any]:
+        """Walk SNMP subtree using GETBULK."""
+        if max_repetitions is None:
+            max_repetitions = self.config.bulk_max_repetitions
         
+        results = {}
+        async for oid_str, value in self.walk_stream(oid, max_repetitions):
+            results[oid_str] = value
         return results
     
     async def set(self, oid: str, value: Any, value_type: str = "integer") -> bool:
         """Set SNMP value."""
+        use_aio = self._aio_backend is not None and value_type in AioSnmpBackend.TYPE_CTORS
         try:
-            # Convert value based on type
-            if value_type == "integer":
-                snmp_value = Integer(value)
-            elif value_type == "string":
-                snmp_value = OctetString(value)
-            elif value_type == "gauge":
-                snmp_value = Gauge32(value)
-            else:
-                snmp_value = value
+            if use_aio:
+                async with self._sem:
+                    await self._aio_backend.set(_oid_str(oid), value, value_type)
+                return True
             
-            iterator = setCmd(
-                self.engine,
-                self.community_data,
-                self.transport_target,
-                self.context_data,
-                ObjectType(ObjectIdentity(oid), snmp_value)
-            )
+            # Convert value based on type
+            snmp_value = _TYPE_CTORS.get(value_type, _identity)(value)
             
-            error_indication, error_status, error_index, var_binds = await iterator
+            async with self._sem:
+                iterator = setCmd(
+                    self.engine,
+                    self.community_data,
+                    self.transport_target,
+                    self.context_data,
+                    ObjectType(_oid_identity(oid), snmp_value)
+                )
+                
+                error_indication, error_status, error_index, var_binds = await iterator
             
             if error_indication:
                 logger.error(f"SNMP set error indication: {error_indication}")
@@ -250,6 +697,7 @@ class SNMPService:
             
         except Exception as e:
             logger.error(f"SNMP set error for OID {oid}: {e}")
+            self._reset_snmp(aio=use_aio)
             return False
 
 
@@ -319,11 +767,66 @@ class ZTEOLTService(SNMPService):
     OID_ONT_REBOOT = "1.3.6.1.4.1.3902.1012.3.50.11.3.1.1"
     OID_PORT_ENABLE = "1.3.6.1.4.1.3902.1012.3.28.1.1.20"
     
-    def __init__(self, config: SNMPConfig):
-        super().__init__(config)
+    # Pre-parsed column prefixes, indexed by slot.port / slot.port.ont_id
+    _PORT_OID_PREFIXES = tuple(map(_oid_tuple, (
+        OID_PORT_ADMIN_STATUS,
+        OID_PORT_OPER_STATUS,
+        OID_PORT_ONT_COUNT,
+        OID_PORT_MAX_ONT,
+        OID_PORT_OPTICAL_TX,
+        OID_PORT_OPTICAL_RX,
+        OID_PORT_TEMPERATURE,
+        OID_PORT_VOLTAGE,
+        OID_PORT_BIAS_CURRENT,
+        OID_PORT_RX_BYTES,
+        OID_PORT_TX_BYTES,
+        OID_PORT_RX_PACKETS,
+        OID_PORT_TX_PACKETS,
+        OID_PORT_RX_ERRORS,
+        OID_PORT_TX_ERRORS
+    )))
+    
+    _ONT_OID_PREFIXES = tuple(map(_oid_tuple, (
+        OID_ONT_STATUS,
+        OID_ONT_DISTANCE,
+        OID_ONT_RX_POWER,
+        OID_ONT_TX_POWER,
+        OID_ONT_VOLTAGE,
+        OID_ONT_TEMPERATURE,
+        OID_ONT_SERIAL,
+        OID_ONT_FIRMWARE,
+        OID_ONT_HARDWARE,
+        OID_ONT_MAC,
+        OID_ONT_UPTIME,
+        OID_ONT_RX_BYTES,
+        OID_ONT_TX_BYTES,
+        OID_ONT_RX_PACKETS,
+        OID_ONT_TX_PACKETS
+    )))
+    
+    def __init__(self, config: SNMPConfig, engine: Optional[SnmpEngine] = None):
+        super().__init__(config, engine)
         self.device_cache = {}
         self.cache_timeout = timedelta(minutes=5)
     
+    def _cache_get(self, key: Tuple) -> Optional[Any]:
+        """Get cached value if it has not expired."""
+        entry = self.device_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, value = entry
+        if datetime.utcnow() - cached_at >= self.cache_timeout:
+            del self.device_cache[key]
+            return None
+        
+        return value
+    
+    def _cache_set(self, key: Tuple, value: Any):
+        """Store value in the device cache."""
+        self.device_cache[key] = (datetime.utcnow(), value)
+    
+    @ttl_cache("olt")
     async def discover_olt(self) -> Optional[OLTInfo]:
         """Discover OLT device information."""
         try:
@@ -342,6 +845,11 @@ class ZTEOLTService(SNMPService):
             
             system_data = await self.get_bulk(system_oids)
             
+            # An empty reply means the poll failed; don't cache a blank OLTInfo
+            if not system_data:
+                logger.error(f"No SNMP response from OLT at {self.config.host}")
+                return None
+            
             # Get performance metrics
             perf_oids = [
                 self.OID_CPU_USAGE,
@@ -353,20 +861,24 @@ class ZTEOLTService(SNMPService):
             
             perf_data = await self.get_bulk(perf_oids)
             
+            if not perf_data:
+                logger.error(f"No SNMP performance data from OLT at {self.config.host}")
+                return None
+            
             # Parse and return OLT info
             olt_info = OLTInfo(
-                system_name=str(system_data.get(self.OID_SYSTEM_NAME, "")),
-                system_description=str(system_data.get(self.OID_SYSTEM_DESC, "")),
-                system_uptime=int(system_data.get(self.OID_SYSTEM_UPTIME, 0)),
-                firmware_version=str(system_data.get(self.OID_FIRMWARE_VERSION, "")),
-                hardware_version=str(system_data.get(self.OID_HARDWARE_VERSION, "")),
-                serial_number=str(system_data.get(self.OID_SERIAL_NUMBER, "")),
-                mac_address=str(system_data.get(self.OID_MAC_ADDRESS, "")),
-                cpu_usage=float(perf_data.get(self.OID_CPU_USAGE, 0)),
-                memory_usage=float(perf_data.get(self.OID_MEMORY_USAGE, 0)),
-                temperature=float(perf_data.get(self.OID_TEMPERATURE, 0)),
-                fan_speed=int(perf_data.get(self.OID_FAN_SPEED, 0)),
-                power_consumption=float(perf_data.get(self.OID_POWER_CONSUMPTION, 0))
+                system_name=_as_str(system_data.get(self.OID_SYSTEM_NAME)),
+                system_description=_as_str(system_data.get(self.OID_SYSTEM_DESC)),
+                system_uptime=_as_int(system_data.get(self.OID_SYSTEM_UPTIME)),
+                firmware_version=_as_str(system_data.get(self.OID_FIRMWARE_VERSION)),
+                hardware_version=_as_str(system_data.get(self.OID_HARDWARE_VERSION)),
+                serial_number=_as_str(system_data.get(self.OID_SERIAL_NUMBER)),
+                mac_address=_as_str(system_data.get(self.OID_MAC_ADDRESS)),
+                cpu_usage=_as_float(perf_data.get(self.OID_CPU_USAGE)),
+                memory_usage=_as_float(perf_data.get(self.OID_MEMORY_USAGE)),
+                temperature=_as_float(perf_data.get(self.OID_TEMPERATURE)),
+                fan_speed=_as_int(perf_data.get(self.OID_FAN_SPEED)),
+                power_consumption=_as_float(perf_data.get(self.OID_POWER_CONSUMPTION))
             )
             
             logger.info(f"Successfully discovered OLT: {olt_info.system_name}")
@@ -376,115 +888,117 @@ class ZTEOLTService(SNMPService):
             logger.error(f"Failed to discover OLT: {e}")
             return None
     
+    # Counter deltas must be computed on every poll, so never cache them
+    @ttl_cache("port", bypass=lambda self: self.config.track_deltas)
     async def get_port_info(self, slot: int, port: int) -> Optional[PortInfo]:
         """Get specific port information."""
         try:
-            port_index = f"{slot}.{port}"
+            port_index = (slot, port)
             
             # Build OIDs with port index
-            port_oids = [
-                f"{self.OID_PORT_ADMIN_STATUS}.{port_index}",
-                f"{self.OID_PORT_OPER_STATUS}.{port_index}",
-                f"{self.OID_PORT_ONT_COUNT}.{port_index}",
-                f"{self.OID_PORT_MAX_ONT}.{port_index}",
-                f"{self.OID_PORT_OPTICAL_TX}.{port_index}",
-                f"{self.OID_PORT_OPTICAL_RX}.{port_index}",
-                f"{self.OID_PORT_TEMPERATURE}.{port_index}",
-                f"{self.OID_PORT_VOLTAGE}.{port_index}",
-                f"{self.OID_PORT_BIAS_CURRENT}.{port_index}",
-                f"{self.OID_PORT_RX_BYTES}.{port_index}",
-                f"{self.OID_PORT_TX_BYTES}.{port_index}",
-                f"{self.OID_PORT_RX_PACKETS}.{port_index}",
-                f"{self.OID_PORT_TX_PACKETS}.{port_index}",
-                f"{self.OID_PORT_RX_ERRORS}.{port_index}",
-                f"{self.OID_PORT_TX_ERRORS}.{port_index}"
-            ]
+            port_oids = [prefix + port_index for prefix in self._PORT_OID_PREFIXES]
             
-            port_data = await self.get_bulk(port_oids)
+            # sysUpTime in the same PDU lets deltas detect agent restarts
+            if self.config.track_deltas:
+                port_oids.append(self.OID_SYSTEM_UPTIME)
             
-            if not port_data:
+            port_values = await self.get_values(port_oids)
+            
+            if not port_values:
                 return None
             
+            if self.config.track_deltas:
+                uptime = _as_int(port_values.pop())
+            
+            (admin_status, oper_status, ont_count, max_ont, optical_tx, optical_rx,
+             temperature, voltage, bias_current, rx_bytes, tx_bytes, rx_packets,
+             tx_packets, rx_errors, tx_errors) = port_values
+            
             port_info = PortInfo(
                 slot=slot,
                 port=port,
-                admin_status=bool(port_data.get(f"{self.OID_PORT_ADMIN_STATUS}.{port_index}", 0)),
-                oper_status="up" if port_data.get(f"{self.OID_PORT_OPER_STATUS}.{port_index}", 0) == 1 else "down",
-                ont_count=int(port_data.get(f"{self.OID_PORT_ONT_COUNT}.{port_index}", 0)),
-                max_ont_count=int(port_data.get(f"{self.OID_PORT_MAX_ONT}.{port_index}", 0)),
-                optical_power_tx=float(port_data.get(f"{self.OID_PORT_OPTICAL_TX}.{port_index}", 0)) / 100,
-                optical_power_rx=float(port_data.get(f"{self.OID_PORT_OPTICAL_RX}.{port_index}", 0)) / 100,
-                temperature=float(port_data.get(f"{self.OID_PORT_TEMPERATURE}.{port_index}", 0)) / 100,
-                voltage=float(port_data.get(f"{self.OID_PORT_VOLTAGE}.{port_index}", 0)) / 1000,
-                bias_current=float(port_data.get(f"{self.OID_PORT_BIAS_CURRENT}.{port_index}", 0)) / 1000,
-                rx_bytes=int(port_data.get(f"{self.OID_PORT_RX_BYTES}.{port_index}", 0)),
-                tx_bytes=int(port_data.get(f"{self.OID_PORT_TX_BYTES}.{port_index}", 0)),
-                rx_packets=int(port_data.get(f"{self.OID_PORT_RX_PACKETS}.{port_index}", 0)),
-                tx_packets=int(port_data.get(f"{self.OID_PORT_TX_PACKETS}.{port_index}", 0)),
-                rx_errors=int(port_data.get(f"{self.OID_PORT_RX_ERRORS}.{port_index}", 0)),
-                tx_errors=int(port_data.get(f"{self.OID_PORT_TX_ERRORS}.{port_index}", 0))
+                admin_status=bool(_as_int(admin_status)),
+                oper_status="up" if _as_int(oper_status) == 1 else "down",
+                ont_count=_as_int(ont_count),
+                max_ont_count=_as_int(max_ont),
+                optical_power_tx=_as_float(optical_tx) / 100,
+                optical_power_rx=_as_float(optical_rx) / 100,
+                temperature=_as_float(temperature) / 100,
+                voltage=_as_float(voltage) / 1000,
+                bias_current=_as_float(bias_current) / 1000,
+                rx_bytes=_as_int(rx_bytes),
+                tx_bytes=_as_int(tx_bytes),
+                rx_packets=_as_int(rx_packets),
+                tx_packets=_as_int(tx_packets),
+                rx_errors=_as_int(rx_errors),
+                tx_errors=_as_int(tx_errors)
             )
             
+            if self.config.track_deltas:
+                counters = {
+                    "rx_bytes": rx_bytes,
+                    "tx_bytes": tx_bytes,
+                    "rx_packets": rx_packets,
+                    "tx_packets": tx_packets,
+                    "rx_errors": rx_errors,
+                    "tx_errors": tx_errors
+                }
+                port_info.deltas = {
+                    name: self._counter_delta((slot, port, name), value, uptime)
+                    for name, value in counters.items()
+                }
+            
             return port_info
             
         except Exception as e:
             logger.error(f"Failed to get port info for {slot}/{port}: {e}")
             return None
     
+    @staticmethod
+    def _build_ont_info(ont_id: int, values: List[Any]) -> ONTInfo:
+        """Build ONTInfo from column values in _ONT_OID_PREFIXES order."""
+        (status_code, distance, rx_power, tx_power, voltage, temperature,
+         serial, firmware, hardware, mac, uptime, rx_bytes, tx_bytes,
+         rx_packets, tx_packets) = values
+        
+        # Parse status
+        status_code = _as_int(status_code)
+        status = _ONT_STATUS[status_code] if 0 <= status_code < len(_ONT_STATUS) else "unknown"
+        
+        return ONTInfo(
+            ont_id=ont_id,
+            serial_number=_as_str(serial),
+            status=status,
+            distance=_as_int(distance),
+            rx_power=_as_float(rx_power) / 100,
+            tx_power=_as_float(tx_power) / 100,
+            voltage=_as_float(voltage) / 1000,
+            temperature=_as_float(temperature) / 100,
+            firmware_version=_as_str(firmware),
+            hardware_version=_as_str(hardware),
+            mac_address=_as_str(mac),
+            uptime=_as_int(uptime),
+            rx_bytes=_as_int(rx_bytes),
+            tx_bytes=_as_int(tx_bytes),
+            rx_packets=_as_int(rx_packets),
+            tx_packets=_as_int(tx_packets)
+        )
+    
+    @ttl_cache("ont")
     async def get_ont_info(self, slot: int, port: int, ont_id: int) -> Optional[ONTInfo]:
         """Get specific ONT information."""
         try:
-            ont_index = f"{slot}.{port}.{ont_id}"
+            ont_index = (slot, port, ont_id)
             
             # Build OIDs with ONT index
-            ont_oids = [
-                f"{self.OID_ONT_STATUS}.{ont_index}",
-                f"{self.OID_ONT_DISTANCE}.{ont_index}",
-                f"{self.OID_ONT_RX_POWER}.{ont_index}",
-                f"{self.OID_ONT_TX_POWER}.{ont_index}",
-                f"{self.OID_ONT_VOLTAGE}.{ont_index}",
-                f"{self.OID_ONT_TEMPERATURE}.{ont_index}",
-                f"{self.OID_ONT_SERIAL}.{ont_index}",
-                f"{self.OID_ONT_FIRMWARE}.{ont_index}",
-                f"{self.OID_ONT_HARDWARE}.{ont_index}",
-                f"{self.OID_ONT_MAC}.{ont_index}",
-                f"{self.OID_ONT_UPTIME}.{ont_index}",
-                f"{self.OID_ONT_RX_BYTES}.{ont_index}",
-                f"{self.OID_ONT_TX_BYTES}.{ont_index}",
-                f"{self.OID_ONT_RX_PACKETS}.{ont_index}",
-                f"{self.OID_ONT_TX_PACKETS}.{ont_index}"
-            ]
+            ont_oids = [prefix + ont_index for prefix in self._ONT_OID_PREFIXES]
             
-            ont_data = await self.get_bulk(ont_oids)
+            ont_values = await self.get_values(ont_oids)
             
-            if not ont_data:
+            if not ont_values:
                 return None
             
-            # Parse status
-            status_code = int(ont_data.get(f"{self.OID_ONT_STATUS}.{ont_index}", 0))
-            status_map = {1: "online", 2: "offline", 3: "dying_gasp", 4: "los"}
-            status = status_map.get(status_code, "unknown")
-            
-            ont_info = ONTInfo(
-                ont_id=ont_id,
-                serial_number=str(ont_data.get(f"{self.OID_ONT_SERIAL}.{ont_index}", "")),
-                status=status,
-                distance=int(ont_data.get(f"{self.OID_ONT_DISTANCE}.{ont_index}", 0)),
-                rx_power=float(ont_data.get(f"{self.OID_ONT_RX_POWER}.{ont_index}", 0)) / 100,
-                tx_power=float(ont_data.get(f"{self.OID_ONT_TX_POWER}.{ont_index}", 0)) / 100,
-                voltage=float(ont_data.get(f"{self.OID_ONT_VOLTAGE}.{ont_index}", 0)) / 1000,
-                temperature=float(ont_data.get(f"{self.OID_ONT_TEMPERATURE}.{ont_index}", 0)) / 100,
-                firmware_version=str(ont_data.get(f"{self.OID_ONT_FIRMWARE}.{ont_index}", "")),
-                hardware_version=str(ont_data.get(f"{self.OID_ONT_HARDWARE}.{ont_index}", "")),
-                mac_address=str(ont_data.get(f"{self.OID_ONT_MAC}.{ont_index}", "")),
-                uptime=int(ont_data.get(f"{self.OID_ONT_UPTIME}.{ont_index}", 0)),
-                rx_bytes=int(ont_data.get(f"{self.OID_ONT_RX_BYTES}.{ont_index}", 0)),
-                tx_bytes=int(ont_data.get(f"{self.OID_ONT_TX_BYTES}.{ont_index}", 0)),
-                rx_packets=int(ont_data.get(f"{self.OID_ONT_RX_PACKETS}.{ont_index}", 0)),
-                tx_packets=int(ont_data.get(f"{self.OID_ONT_TX_PACKETS}.{ont_index}", 0))
-            )
-            
-            return ont_info
+            return self._build_ont_info(ont_id, ont_values)
             
         except Exception as e:
             logger.error(f"Failed to get ONT info for {slot}/{port}/{ont_id}: {e}")
@@ -495,22 +1009,18 @@ class ZTEOLTService(SNMPService):
         ports = []
         
         try:
-            # Walk port admin status to find all ports
-            port_status_data = await self.walk(self.OID_PORT_ADMIN_STATUS)
-            
-            for oid, value in port_status_data.items():
+            # Walk port admin status and query each port as soon as its row arrives
+            tasks = []
+            async for oid, _ in self.walk_stream(self.OID_PORT_ADMIN_STATUS):
                 # Extract slot and port from OID
-                oid_parts = oid.split('.')
-                if len(oid_parts) >= 2:
-                    try:
-                        slot = int(oid_parts[-2])
-                        port = int(oid_parts[-1])
-                        
-                        port_info = await self.get_port_info(slot, port)
-                        if port_info:
-                            ports.append(port_info)
-                    except (ValueError, IndexError):
-                        continue
+                try:
+                    slot, port = _tail2(oid)
+                except ValueError:
+                    continue
+                tasks.append(asyncio.create_task(self.get_port_info(slot, port)))
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            ports = [r for r in results if isinstance(r, PortInfo)]
             
             logger.info(f"Discovered {len(ports)} ports")
             return ports
@@ -524,22 +1034,23 @@ class ZTEOLTService(SNMPService):
         onts = []
         
         try:
-            # Walk ONT status for the specific port
-            ont_status_oid = f"{self.OID_ONT_STATUS}.{slot}.{port}"
-            ont_status_data = await self.walk(ont_status_oid)
-            
-            for oid, value in ont_status_data.items():
-                # Extract ONT ID from OID
-                oid_parts = oid.split('.')
-                if len(oid_parts) >= 1:
-                    try:
-                        ont_id = int(oid_parts[-1])
-                        
-                        ont_info = await self.get_ont_info(slot, port, ont_id)
-                        if ont_info:
-                            onts.append(ont_info)
-                    except (ValueError, IndexError):
-                        continue
+            # Walk every ONT column for the port concurrently
+            columns = await asyncio.gather(*(
+                self.walk_bulk(_oid_str(prefix + (slot, port)))
+                for prefix in self._ONT_OID_PREFIXES
+            ))
+            
+            # Re-key each column by ONT ID
+            ont_columns = [
+                {_tail1(oid): value for oid, value in column.items()}
+                for column in columns
+            ]
+            
+            for ont_id in sorted(ont_columns[0]):
+                try:
+                    onts.append(self._build_ont_info(ont_id, [column.get(ont_id) for column in ont_columns]))
+                except (ValueError, TypeError):
+                    continue
             
             logger.info(f"Discovered {len(onts)} ONTs on port {slot}/{port}")
             return onts
@@ -548,6 +1059,122 @@ class ZTEOLTService(SNMPService):
             logger.error(f"Failed to discover ONTs on port {slot}/{port}: {e}")
             return []
     
+    async def discover_all_ports_soa(self) -> Dict[str, np.ndarray]:
+        """Discover all ports on the OLT as column arrays.
+        
+        Counterpart of ``discover_all_onts_soa`` for ports. Field names
+        match ``PortInfo``; counters stay int64 so they are not rounded.
+        """
+        try:
+            columns = await asyncio.gather(*(
+                self.walk_bulk(_oid_str(prefix))
+                for prefix in self._PORT_OID_PREFIXES
+            ))
+            
+            # Re-key each column by (slot, port)
+            (admin_status, oper_status, ont_count, max_ont, optical_tx, optical_rx,
+             temperature, voltage, bias_current, rx_bytes, tx_bytes, rx_packets,
+             tx_packets, rx_errors, tx_errors) = [
+                {_tail2(oid): value for oid, value in column.items()}
+                for column in columns
+            ]
+            
+            port_indexes = sorted(admin_status)
+            count = len(port_indexes)
+            
+            analog = np.stack(
+                [_int_column(column, port_indexes)
+                 for column in (optical_tx, optical_rx, temperature, voltage, bias_current)],
+                axis=1
+            ).astype(np.float32) * _PORT_SCALE
+            
+            ports = {
+                "slot": np.fromiter((slot for slot, _ in port_indexes), dtype=np.int64, count=count),
+                "port": np.fromiter((port for _, port in port_indexes), dtype=np.int64, count=count),
+                "admin_status": _int_column(admin_status, port_indexes).astype(bool),
+                "oper_status": np.where(_int_column(oper_status, port_indexes) == 1, "up", "down"),
+                "ont_count": _int_column(ont_count, port_indexes),
+                "max_ont_count": _int_column(max_ont, port_indexes),
+                "optical_power_tx": analog[:, 0],
+                "optical_power_rx": analog[:, 1],
+                "temperature": analog[:, 2],
+                "voltage": analog[:, 3],
+                "bias_current": analog[:, 4],
+                "rx_bytes": _int_column(rx_bytes, port_indexes),
+                "tx_bytes": _int_column(tx_bytes, port_indexes),
+                "rx_packets": _int_column(rx_packets, port_indexes),
+                "tx_packets": _int_column(tx_packets, port_indexes),
+                "rx_errors": _int_column(rx_errors, port_indexes),
+                "tx_errors": _int_column(tx_errors, port_indexes)
+            }
+            
+            logger.info(f"Discovered {count} ports")
+            return ports
+            
+        except Exception as e:
+            logger.error(f"Failed to discover ports: {e}")
+            return {}
+    
+    async def discover_all_onts_soa(self, slot: int, port: int) -> Dict[str, np.ndarray]:
+        """Discover all ONTs on a port as column arrays.
+        
+        Each ONT column is walked independently and returned as one numpy
+        array per field (aligned by ``ont_id``), avoiding per-ONT object
+        construction for large ports. Field names match ``ONTInfo``.
+        """
+        try:
+            columns = await asyncio.gather(*(
+                self.walk_bulk(_oid_str(prefix + (slot, port)))
+                for prefix in self._ONT_OID_PREFIXES
+            ))
+            
+            # Re-key each column by ONT ID
+            (status, distance, rx_power, tx_power, voltage, temperature,
+             serial, firmware, hardware, mac, uptime, rx_bytes, tx_bytes,
+             rx_packets, tx_packets) = [
+                {_tail1(oid): value for oid, value in column.items()}
+                for column in columns
+            ]
+            
+            ont_ids = sorted(status)
+            count = len(ont_ids)
+            
+            # Map unknown status codes to 0 ("unknown")
+            status_codes = _int_column(status, ont_ids)
+            status_codes[(status_codes < 0) | (status_codes >= len(_ONT_STATUS))] = 0
+            
+            # Scale all analog readings in one broadcast multiply
+            analog = np.stack(
+                [_int_column(column, ont_ids) for column in (rx_power, tx_power, voltage, temperature)],
+                axis=1
+            ).astype(np.float32) * _ONT_SCALE
+            
+            onts = {
+                "ont_id": np.array(ont_ids, dtype=np.int64),
+                "serial_number": _str_column(serial, ont_ids),
+                "status": _ONT_STATUS_NAMES[status_codes],
+                "distance": _int_column(distance, ont_ids),
+                "rx_power": analog[:, 0],
+                "tx_power": analog[:, 1],
+                "voltage": analog[:, 2],
+                "temperature": analog[:, 3],
+                "firmware_version": _str_column(firmware, ont_ids),
+                "hardware_version": _str_column(hardware, ont_ids),
+                "mac_address": _str_column(mac, ont_ids),
+                "uptime": _int_column(uptime, ont_ids),
+                "rx_bytes": _int_column(rx_bytes, ont_ids),
+                "tx_bytes": _int_column(tx_bytes, ont_ids),
+                "rx_packets": _int_column(rx_packets, ont_ids),
+                "tx_packets": _int_column(tx_packets, ont_ids)
+            }
+            
+            logger.info(f"Discovered {count} ONTs on port {slot}/{port}")
+            return onts
+            
+        except Exception as e:
+            logger.error(f"Failed to discover ONTs on port {slot}/{port}: {e}")
+            return {}
+    
     async def provision_ont(self, slot: int, port: int, ont_id: int, serial_number: str) -> bool:
         """Provision ONT on the OLT."""
         try:
@@ -617,4 +1244,37 @@ class ZTEOLTService(SNMPService):
             return system_name is not None
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class MultiDevicePoller:
+    """Poll multiple OLTs concurrently over a single shared SNMP engine.
+    
+    All services share one SnmpEngine, so outstanding requests to every
+    device are multiplexed over the engine's UDP transport and matched
+    back by request-id, instead of each device owning its own socket.
+    """
+    
+    def __init__(self, configs: List[SNMPConfig], service_class=ZTEOLTService):
+        self.engine = SnmpEngine()
+        self.services: Dict[str, SNMPService] = {
+            config.host: service_class(config, engine=self.engine)
+            for config in configs
+        }
+    
+    async def poll(self, method: str, *args, **kwargs) -> Dict[str, Any]:
+        """Call a service method on every device concurrently."""
+        hosts = list(self.services)
+        results = await asyncio.gather(
+            *(getattr(self.services[host], method)(*args, **kwargs) for host in hosts),
+            return_exceptions=True
+        )
+        
+        polled = {}
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                logger.error(f"Polling {method} on {host} failed: {result}")
+                result = None
+            polled[host] = result
+        
+        return polled
@@ -2,14 +2,22 @@
 WebSocket service for real-time updates.
 """
 
-import json
+import heapq
 import logging
+import os
 import asyncio
-from typing import Dict, List, Set, Optional, Any
+import time
+import functools
+import itertools
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Set, Optional, Any, Tuple, Deque, Iterable, Iterator, Callable
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
@@ -24,6 +32,7 @@ class MessageType(str, Enum):
     PING = "ping"
     PONG = "pong"
     ERROR = "error"
+    BATCH = "batch"
     
     # Authentication
     AUTH = "auth"
@@ -56,7 +65,61 @@ class MessageType(str, Enum):
     SUBSCRIPTION_CONFIRMED = "subscription_confirmed"
 
 
-@dataclass
+# High-frequency frames that may be batched together or dropped when a client falls behind
+_METRICS_TYPES = frozenset({MessageType.METRICS_UPDATE, MessageType.PERFORMANCE_DATA})
+
+# orjson options for message payloads; non-str keys are coerced like json.dumps
+_DATA_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+# Pre-built frames for fixed-shape server replies; user_id and topic are
+# inserted as JSON literals since they may be null or client-supplied
+_PONG_TEMPLATE = (
+    '{{"type":"pong","data":{{"timestamp":"{ts}"}},'
+    '"timestamp":"{ts}","user_id":{user_id},"session_id":"{session_id}"}}'
+)
+_SUBSCRIBED_TEMPLATE = (
+    '{{"type":"subscription_confirmed","data":{{"topic":{topic},"status":"subscribed"}},'
+    '"timestamp":"{ts}","user_id":{user_id},"session_id":"{session_id}"}}'
+)
+
+
+def per_message_deflate_enabled() -> bool:
+    """Whether uvicorn should negotiate permessage-deflate.
+    
+    Read from ``WS_PER_MESSAGE_DEFLATE`` (off by default; see .env.example).
+    """
+    return os.getenv("WS_PER_MESSAGE_DEFLATE", "false").lower() == "true"
+
+
+def _json_literal(value: Any) -> str:
+    """Encode a scalar as a JSON literal for insertion into a frame template."""
+    return orjson.dumps(value).decode()
+
+
+def _make_dispatcher(group: Dict[int, "ClientConnection"]) -> Callable[[MessageType, str], int]:
+    """Build a fan-out function bound to one topic's subscriber group.
+    
+    The closure holds a live view of the group, so it stays valid as
+    members come and go and only needs dropping when the group is deleted.
+    """
+    connections = group.values()
+    
+    def dispatch(message_type: MessageType, payload: str) -> int:
+        for connection in connections:
+            connection.enqueue(message_type, payload)
+        return len(connections)
+    
+    return dispatch
+
+
+@functools.lru_cache(maxsize=4096)
+def _topic(kind: str, device_type: str, device_id: str) -> str:
+    """Build a per-device topic name, reusing the same string for repeat publishes."""
+    return f"{device_type}.{device_id}.{kind}"
+
+
+@dataclass(slots=True)
 class WebSocketMessage:
     """WebSocket message structure."""
     type: MessageType
@@ -64,11 +127,22 @@ class WebSocketMessage:
     timestamp: datetime = None
     user_id: Optional[str] = None
     session_id: Optional[str] = None
+    _cached: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
     
+    def reset(self, type: MessageType, data: Any, user_id: Optional[str] = None,
+              session_id: Optional[str] = None):
+        """Re-initialize a pooled message for a new event."""
+        self.type = type
+        self.data = data
+        self.timestamp = datetime.utcnow()
+        self.user_id = user_id
+        self.session_id = session_id
+        self._cached = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary."""
         return {
@@ -79,20 +153,86 @@ class WebSocketMessage:
             "session_id": self.session_id
         }
     
+    def to_bytes(self) -> bytes:
+        """Convert message to UTF-8 encoded JSON.
+        
+        Only the data payload goes through orjson; the fixed envelope is
+        assembled around it, so no intermediate dict is built per message.
+        Non-str dict keys are coerced to strings as json.dumps did, but
+        datetimes inside ``data`` are emitted in ISO 8601 ("T" separator),
+        matching the envelope timestamp.
+        """
+        return b"".join((
+            b'{"type":"', self.type.value.encode(),
+            b'","data":', orjson.dumps(self.data, default=str, option=_DATA_OPTS),
+            b',"timestamp":"', self.timestamp.isoformat().encode(),
+            b'","user_id":', orjson.dumps(self.user_id),
+            b',"session_id":', orjson.dumps(self.session_id),
+            b"}"
+        ))
+    
     def to_json(self) -> str:
         """Convert message to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return self.to_bytes().decode()
+    
+    def to_payload(self) -> str:
+        """Serialize message once and reuse the JSON for every recipient."""
+        if self._cached is None:
+            self._cached = self.to_json()
+        return self._cached
+
+
+class _MessagePool:
+    """Free list of WebSocketMessage instances reused for server-side events.
+    
+    A message is only borrowed for the duration of its broadcasts; the
+    payload is serialized and queued synchronously, so nothing refers to
+    the instance once the block exits.
+    """
+    
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._free: List[WebSocketMessage] = []
+    
+    @contextmanager
+    def allocate(self, type: MessageType, data: Any,
+                 user_id: Optional[str] = None) -> Iterator[WebSocketMessage]:
+        """Borrow a message initialized with type, data and recipient."""
+        if self._free:
+            message = self._free.pop()
+            message.reset(type, data, user_id)
+        else:
+            message = WebSocketMessage(type=type, data=data, user_id=user_id)
+        
+        try:
+            yield message
+        finally:
+            # Drop references to the event data before returning to the pool
+            message.data = None
+            message._cached = None
+            if len(self._free) < self.capacity:
+                self._free.append(message)
+
 
+_message_pool = _MessagePool()
 
-@dataclass
+
+@dataclass(slots=True)
 class ClientConnection:
     """WebSocket client connection info."""
     websocket: WebSocket
     user_id: Optional[str] = None
     session_id: Optional[str] = None
+    handle: int = 0
     subscriptions: Set[str] = None
     connected_at: datetime = None
     last_ping: datetime = None
+    outbox: Deque[Tuple[MessageType, str]] = field(default_factory=deque, repr=False)
+    wake: Optional[asyncio.Future] = field(default=None, repr=False)
+    writer_task: Optional[asyncio.Task] = field(default=None, repr=False)
+    
+    # Frames queued beyond this are dropped, oldest metrics first
+    MAX_OUTBOX = 256
     
     def __post_init__(self):
         if self.subscriptions is None:
@@ -111,17 +251,43 @@ class ClientConnection:
     def is_connected(self) -> bool:
         """Check if WebSocket is still connected."""
         return self.websocket.client_state == WebSocketState.CONNECTED
+    
+    def enqueue(self, message_type: MessageType, payload: str):
+        """Queue a serialized frame for the writer task without awaiting the socket."""
+        if len(self.outbox) >= self.MAX_OUTBOX:
+            for index, (queued_type, _) in enumerate(self.outbox):
+                if queued_type in _METRICS_TYPES:
+                    del self.outbox[index]
+                    break
+            else:
+                self.outbox.popleft()
+            logger.warning(f"Send queue full for {self.session_id}, dropped oldest frame")
+        
+        self.outbox.append((message_type, payload))
+        if self.wake is not None and not self.wake.done():
+            self.wake.set_result(None)
 
 
 class WebSocketManager:
     """WebSocket connection manager."""
     
+    # Connections without a ping for this long get their state checked
+    PING_TIMEOUT_SECONDS = 60.0
+    
     def __init__(self):
+        # External API is keyed by connection_id string; internal groups
+        # are keyed by the connection's integer handle
         self.connections: Dict[str, ClientConnection] = {}
-        self.user_connections: Dict[str, Set[str]] = {}  # user_id -> set of connection_ids
-        self.subscription_groups: Dict[str, Set[str]] = {}  # topic -> set of connection_ids
-        self._connection_counter = 0
+        self.user_connections: Dict[str, Dict[int, ClientConnection]] = {}  # user_id -> {handle: connection}
+        self.subscription_groups: Dict[str, Dict[int, ClientConnection]] = {}  # topic -> {handle: connection}
+        self._dispatchers: Dict[str, Callable[[MessageType, str], int]] = {}  # topic -> fan-out closure
+        self._next_handle = itertools.count(1)
+        self._auth_count = 0  # authenticated connections
+        self._sub_count = 0  # subscriptions across all connections
         self._cleanup_task = None
+        self._ping_heap: List[Tuple[float, int, int, ClientConnection]] = []  # (deadline, handle, seq, connection)
+        self._ping_seq = itertools.count()  # tiebreaker so connections are never compared
+        self._ping_deadlines: Dict[int, float] = {}  # handle -> current deadline
     
     def start_cleanup_task(self):
         """Start background cleanup task."""
@@ -134,19 +300,44 @@ class WebSocketManager:
             self._cleanup_task.cancel()
             self._cleanup_task = None
     
+    def _schedule_ping_check(self, connection: ClientConnection):
+        """Push connection's next ping deadline onto the timeout heap."""
+        deadline = time.monotonic() + self.PING_TIMEOUT_SECONDS
+        self._ping_deadlines[connection.handle] = deadline
+        heapq.heappush(
+            self._ping_heap, (deadline, connection.handle, next(self._ping_seq), connection)
+        )
+    
     async def _cleanup_connections(self):
-        """Cleanup disconnected connections periodically."""
+        """Check connections whose ping deadline expired.
+        
+        Disconnects are handled immediately by the WebSocket route; this
+        only guards against silently dead peers. Only expired heap entries
+        are visited, so the work is proportional to idle connections rather
+        than to all connections.
+        """
         while True:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                now = time.monotonic()
+                
+                while self._ping_heap and self._ping_heap[0][0] <= now:
+                    deadline, handle, _, connection = heapq.heappop(self._ping_heap)
+                    
+                    # Skip entries superseded by a later ping or removal
+                    if self._ping_deadlines.get(handle) != deadline:
+                        continue
+                    
+                    if connection.is_connected:
+                        self._schedule_ping_check(connection)
+                    else:
+                        await self._remove_connection(connection.session_id)
                 
-                disconnected_ids = []
-                for conn_id, connection in self.connections.items():
-                    if not connection.is_connected:
-                        disconnected_ids.append(conn_id)
+                if self._ping_heap:
+                    delay = self._ping_heap[0][0] - now
+                else:
+                    delay = self.PING_TIMEOUT_SECONDS
                 
-                for conn_id in disconnected_ids:
-                    await self._remove_connection(conn_id)
+                await asyncio.sleep(max(delay, 1.0))
                 
             except asyncio.CancelledError:
                 break
@@ -158,16 +349,20 @@ class WebSocketManager:
         await websocket.accept()
         
         # Generate unique connection ID
-        self._connection_counter += 1
-        connection_id = f"conn_{self._connection_counter}_{datetime.utcnow().timestamp()}"
+        connection_id = uuid.uuid4().hex
         
         # Create connection object
         connection = ClientConnection(
             websocket=websocket,
-            session_id=connection_id
+            session_id=connection_id,
+            handle=next(self._next_handle)
         )
         
         self.connections[connection_id] = connection
+        self._schedule_ping_check(connection)
+        
+        connection.wake = asyncio.get_running_loop().create_future()
+        connection.writer_task = asyncio.create_task(self._writer_loop(connection_id, connection))
         
         # Send connection confirmation
         message = WebSocketMessage(
@@ -186,28 +381,89 @@ class WebSocketManager:
         await self._remove_connection(connection_id)
         logger.info(f"WebSocket connection closed: {connection_id}")
     
+    async def _writer_loop(self, connection_id: str, connection: ClientConnection):
+        """Drain a connection's outbox onto its WebSocket.
+        
+        Producers only append to the outbox, so a slow client backs up its
+        own queue instead of the publisher. Metrics frames queued together
+        go out as a single batch frame; everything else keeps its own frame
+        and its position relative to the batches.
+        """
+        loop = asyncio.get_running_loop()
+        websocket = connection.websocket
+        try:
+            while True:
+                await connection.wake
+                connection.wake = loop.create_future()
+                
+                while connection.outbox:
+                    items = [connection.outbox.popleft() for _ in range(len(connection.outbox))]
+                    batch: List[str] = []
+                    
+                    for message_type, payload in items:
+                        if message_type in _METRICS_TYPES:
+                            batch.append(payload)
+                            continue
+                        if batch:
+                            await self._send_batch(websocket, batch)
+                            batch = []
+                        await websocket.send_text(payload)
+                    
+                    if batch:
+                        await self._send_batch(websocket, batch)
+        
+        except asyncio.CancelledError:
+            pass
+        except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
+            logger.info(f"WebSocket {connection_id} closed while sending: {e!r}")
+            await self._remove_connection(connection_id)
+        except Exception as e:
+            logger.error(f"Error sending message to {connection_id}: {e}")
+            await self._remove_connection(connection_id)
+    
+    @staticmethod
+    async def _send_batch(websocket: WebSocket, payloads: List[str]):
+        """Send metrics payloads, wrapping several in one batch envelope."""
+        if len(payloads) == 1:
+            await websocket.send_text(payloads[0])
+        else:
+            await websocket.send_text(
+                f'{{"type":"{MessageType.BATCH.value}","data":[{",".join(payloads)}]}}'
+            )
+    
     async def _remove_connection(self, connection_id: str):
         """Remove connection and cleanup references."""
         if connection_id not in self.connections:
             return
         
         connection = self.connections[connection_id]
+        handle = connection.handle
         
         # Remove from user connections
         if connection.user_id and connection.user_id in self.user_connections:
-            self.user_connections[connection.user_id].discard(connection_id)
+            self.user_connections[connection.user_id].pop(handle, None)
             if not self.user_connections[connection.user_id]:
                 del self.user_connections[connection.user_id]
         
         # Remove from subscription groups
         for topic in connection.subscriptions:
             if topic in self.subscription_groups:
-                self.subscription_groups[topic].discard(connection_id)
+                self.subscription_groups[topic].pop(handle, None)
                 if not self.subscription_groups[topic]:
                     del self.subscription_groups[topic]
+                    del self._dispatchers[topic]
+        
+        if connection.is_authenticated:
+            self._auth_count -= 1
+        self._sub_count -= len(connection.subscriptions)
+        
+        # Stop the writer unless it is the one removing the connection
+        if connection.writer_task is not None and connection.writer_task is not asyncio.current_task():
+            connection.writer_task.cancel()
         
         # Remove connection
         del self.connections[connection_id]
+        self._ping_deadlines.pop(handle, None)
     
     async def authenticate(self, connection_id: str, user_id: str) -> bool:
         """Authenticate WebSocket connection."""
@@ -215,12 +471,14 @@ class WebSocketManager:
             return False
         
         connection = self.connections[connection_id]
+        if connection.user_id is None:
+            self._auth_count += 1
         connection.user_id = user_id
         
         # Add to user connections
         if user_id not in self.user_connections:
-            self.user_connections[user_id] = set()
-        self.user_connections[user_id].add(connection_id)
+            self.user_connections[user_id] = {}
+        self.user_connections[user_id][connection.handle] = connection
         
         # Send authentication success
         message = WebSocketMessage(
@@ -240,22 +498,23 @@ class WebSocketManager:
             return False
         
         connection = self.connections[connection_id]
+        if topic not in connection.subscriptions:
+            self._sub_count += 1
         connection.subscriptions.add(topic)
         
         # Add to subscription group
         if topic not in self.subscription_groups:
-            self.subscription_groups[topic] = set()
-        self.subscription_groups[topic].add(connection_id)
+            self.subscription_groups[topic] = {}
+            self._dispatchers[topic] = _make_dispatcher(self.subscription_groups[topic])
+        self.subscription_groups[topic][connection.handle] = connection
         
         # Send subscription confirmation
-        message = WebSocketMessage(
-            type=MessageType.SUBSCRIPTION_CONFIRMED,
-            data={"topic": topic, "status": "subscribed"},
-            user_id=connection.user_id,
+        connection.enqueue(MessageType.SUBSCRIPTION_CONFIRMED, _SUBSCRIBED_TEMPLATE.format(
+            topic=_json_literal(topic),
+            ts=datetime.utcnow().isoformat(),
+            user_id=_json_literal(connection.user_id),
             session_id=connection_id
-        )
-        
-        await self._send_to_connection(connection_id, message)
+        ))
         logger.info(f"Connection {connection_id} subscribed to {topic}")
         return True
     
@@ -265,91 +524,71 @@ class WebSocketManager:
             return False
         
         connection = self.connections[connection_id]
+        if topic in connection.subscriptions:
+            self._sub_count -= 1
         connection.subscriptions.discard(topic)
         
         # Remove from subscription group
         if topic in self.subscription_groups:
-            self.subscription_groups[topic].discard(connection_id)
+            self.subscription_groups[topic].pop(connection.handle, None)
             if not self.subscription_groups[topic]:
                 del self.subscription_groups[topic]
+                del self._dispatchers[topic]
         
         logger.info(f"Connection {connection_id} unsubscribed from {topic}")
         return True
     
     async def _send_to_connection(self, connection_id: str, message: WebSocketMessage):
-        """Send message to specific connection."""
-        if connection_id not in self.connections:
-            return False
+        """Send message to specific connection.
         
-        connection = self.connections[connection_id]
-        
-        if not connection.is_connected:
-            await self._remove_connection(connection_id)
+        Closed sockets are detected by the writer task when the send fails,
+        so the socket state is not polled before queueing.
+        """
+        connection = self.connections.get(connection_id)
+        if connection is None:
             return False
         
-        try:
-            await connection.websocket.send_text(message.to_json())
-            return True
-        except Exception as e:
-            logger.error(f"Error sending message to {connection_id}: {e}")
-            await self._remove_connection(connection_id)
-            return False
+        connection.enqueue(message.type, message.to_json())
+        return True
+    
+    def _send_payload(self, targets: Iterable[ClientConnection], message: WebSocketMessage) -> int:
+        """Queue pre-serialized message on each target connection.
+        
+        Delivery happens on the per-connection writer tasks, which remove
+        connections whose send failed. Nothing here awaits, so targets may
+        be a live view of the connection maps without copying it first.
+        """
+        message_type = message.type
+        payload = message.to_payload()
+        queued_count = 0
+        for connection in targets:
+            connection.enqueue(message_type, payload)
+            queued_count += 1
+        return queued_count
     
     async def send_to_user(self, user_id: str, message: WebSocketMessage):
         """Send message to all connections of a user."""
         if user_id not in self.user_connections:
             return 0
         
-        connection_ids = list(self.user_connections[user_id])
-        sent_count = 0
-        
-        for connection_id in connection_ids:
-            message.user_id = user_id
-            message.session_id = connection_id
-            
-            if await self._send_to_connection(connection_id, message):
-                sent_count += 1
-        
-        return sent_count
+        return self._send_payload(self.user_connections[user_id].values(), message)
     
     async def broadcast_to_topic(self, topic: str, message: WebSocketMessage):
         """Broadcast message to all subscribers of a topic."""
-        if topic not in self.subscription_groups:
+        dispatch = self._dispatchers.get(topic)
+        if dispatch is None:
             return 0
         
-        connection_ids = list(self.subscription_groups[topic])
-        sent_count = 0
-        
-        for connection_id in connection_ids:
-            if connection_id in self.connections:
-                connection = self.connections[connection_id]
-                message.user_id = connection.user_id
-                message.session_id = connection_id
-                
-                if await self._send_to_connection(connection_id, message):
-                    sent_count += 1
-        
-        return sent_count
+        return dispatch(message.type, message.to_payload())
     
     async def broadcast_to_all(self, message: WebSocketMessage):
         """Broadcast message to all connected clients."""
-        connection_ids = list(self.connections.keys())
-        sent_count = 0
-        
-        for connection_id in connection_ids:
-            connection = self.connections[connection_id]
-            message.user_id = connection.user_id
-            message.session_id = connection_id
-            
-            if await self._send_to_connection(connection_id, message):
-                sent_count += 1
-        
-        return sent_count
+        return self._send_payload(self.connections.values(), message)
     
     async def handle_message(self, connection_id: str, message_data: str):
         """Handle incoming WebSocket message."""
         try:
-            data = json.loads(message_data)
+            data = orjson.loads(message_data)
             message_type = MessageType(data.get("type"))
             message_data = data.get("data", {})
             
@@ -382,28 +621,22 @@ class WebSocketManager:
         if connection_id in self.connections:
             connection = self.connections[connection_id]
             connection.last_ping = datetime.utcnow()
+            self._schedule_ping_check(connection)
             
             # Send pong response
-            pong_message = WebSocketMessage(
-                type=MessageType.PONG,
-                data={"timestamp": datetime.utcnow().isoformat()},
-                user_id=connection.user_id,
+            connection.enqueue(MessageType.PONG, _PONG_TEMPLATE.format(
+                ts=connection.last_ping.isoformat(),
+                user_id=_json_literal(connection.user_id),
                 session_id=connection_id
-            )
-            await self._send_to_connection(connection_id, pong_message)
+            ))
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
-        total_connections = len(self.connections)
-        authenticated_connections = sum(1 for conn in self.connections.values() if conn.is_authenticated)
-        unique_users = len(self.user_connections)
-        total_subscriptions = sum(len(conn.subscriptions) for conn in self.connections.values())
-        
         return {
-            "total_connections": total_connections,
-            "authenticated_connections": authenticated_connections,
-            "unique_users": unique_users,
-            "total_subscriptions": total_subscriptions,
+            "total_connections": len(self.connections),
+            "authenticated_connections": self._auth_count,
+            "unique_users": len(self.user_connections),
+            "total_subscriptions": self._sub_count,
             "subscription_topics": list(self.subscription_groups.keys())
         }
 
@@ -420,110 +653,91 @@ class NotificationService:
     
     async def send_olt_status_update(self, olt_id: str, status_data: Dict[str, Any]):
         """Send OLT status update."""
-        message = WebSocketMessage(
-            type=MessageType.OLT_STATUS,
-            data={
+        with _message_pool.allocate(
+            MessageType.OLT_STATUS,
+            {
                 "olt_id": olt_id,
                 "status": status_data
             }
-        )
-        
-        topic = f"olt.{olt_id}.status"
-        await self.ws_manager.broadcast_to_topic(topic, message)
-        
-        # Also broadcast to general OLT topic
-        await self.ws_manager.broadcast_to_topic("olt.status", message)
+        ) as message:
+            topic = _topic("status", "olt", olt_id)
+            await self.ws_manager.broadcast_to_topic(topic, message)
+            
+            # Also broadcast to general OLT topic
+            await self.ws_manager.broadcast_to_topic("olt.status", message)
     
     async def send_ont_status_update(self, ont_id: str, olt_id: str, status_data: Dict[str, Any]):
         """Send ONT status update."""
-        message = WebSocketMessage(
-            type=MessageType.ONT_STATUS,
-            data={
+        with _message_pool.allocate(
+            MessageType.ONT_STATUS,
+            {
                 "ont_id": ont_id,
                 "olt_id": olt_id,
                 "status": status_data
             }
-        )
-        
-        topic = f"ont.{ont_id}.status"
-        await self.ws_manager.broadcast_to_topic(topic, message)
-        
-        # Also broadcast to OLT-specific ONT topic
-        olt_topic = f"olt.{olt_id}.ont.status"
-        await self.ws_manager.broadcast_to_topic(olt_topic, message)
+        ) as message:
+            topic = _topic("status", "ont", ont_id)
+            await self.ws_manager.broadcast_to_topic(topic, message)
+            
+            # Also broadcast to OLT-specific ONT topic
+            olt_topic = _topic("ont.status", "olt", olt_id)
+            await self.ws_manager.broadcast_to_topic(olt_topic, message)
     
     async def send_performance_data(self, device_id: str, device_type: str, metrics: Dict[str, Any]):
         """Send performance data update."""
-        message = WebSocketMessage(
-            type=MessageType.PERFORMANCE_DATA,
-            data={
+        with _message_pool.allocate(
+            MessageType.PERFORMANCE_DATA,
+            {
                 "device_id": device_id,
                 "device_type": device_type,
                 "metrics": metrics
             }
-        )
-        
-        topic = f"{device_type}.{device_id}.metrics"
-        await self.ws_manager.broadcast_to_topic(topic, message)
-        
-        # Also broadcast to general metrics topic
-        await self.ws_manager.broadcast_to_topic("metrics", message)
+        ) as message:
+            topic = _topic("metrics", device_type, device_id)
+            await self.ws_manager.broadcast_to_topic(topic, message)
+            
+            # Also broadcast to general metrics topic
+            await self.ws_manager.broadcast_to_topic("metrics", message)
     
     async def send_alarm(self, alarm_data: Dict[str, Any]):
         """Send alarm notification."""
-        message = WebSocketMessage(
-            type=MessageType.ALARM,
-            data=alarm_data
-        )
-        
-        # Broadcast to alarm subscribers
-        await self.ws_manager.broadcast_to_topic("alarms", message)
-        
-        # Send to specific device subscribers if device info is available
-        if "device_id" in alarm_data and "device_type" in alarm_data:
-            device_topic = f"{alarm_data['device_type']}.{alarm_data['device_id']}.alarms"
-            await self.ws_manager.broadcast_to_topic(device_topic, message)
+        with _message_pool.allocate(MessageType.ALARM, alarm_data) as message:
+            # Broadcast to alarm subscribers
+            await self.ws_manager.broadcast_to_topic("alarms", message)
+            
+            # Send to specific device subscribers if device info is available
+            if "device_id" in alarm_data and "device_type" in alarm_data:
+                device_topic = _topic("alarms", alarm_data["device_type"], alarm_data["device_id"])
+                await self.ws_manager.broadcast_to_topic(device_topic, message)
     
     async def send_notification(self, notification_data: Dict[str, Any], user_id: str = None):
         """Send general notification."""
-        message = WebSocketMessage(
-            type=MessageType.NOTIFICATION,
-            data=notification_data
-        )
-        
-        if user_id:
-            # Send to specific user
-            await self.ws_manager.send_to_user(user_id, message)
-        else:
-            # Broadcast to all notification subscribers
-            await self.ws_manager.broadcast_to_topic("notifications", message)
+        with _message_pool.allocate(MessageType.NOTIFICATION, notification_data, user_id) as message:
+            if user_id:
+                # Send to specific user
+                await self.ws_manager.send_to_user(user_id, message)
+            else:
+                # Broadcast to all notification subscribers
+                await self.ws_manager.broadcast_to_topic("notifications", message)
     
     async def send_device_discovery(self, device_data: Dict[str, Any], discovered: bool = True):
         """Send device discovery notification."""
         message_type = MessageType.DEVICE_DISCOVERED if discovered else MessageType.DEVICE_LOST
         
-        message = WebSocketMessage(
-            type=message_type,
-            data=device_data
-        )
-        
-        # Broadcast to discovery subscribers
-        await self.ws_manager.broadcast_to_topic("discovery", message)
+        with _message_pool.allocate(message_type, device_data) as message:
+            # Broadcast to discovery subscribers
+            await self.ws_manager.broadcast_to_topic("discovery", message)
     
     async def send_config_change(self, config_data: Dict[str, Any]):
         """Send configuration change notification."""
-        message = WebSocketMessage(
-            type=MessageType.CONFIG_CHANGE,
-            data=config_data
-        )
-        
-        # Broadcast to configuration subscribers
-        await self.ws_manager.broadcast_to_topic("config", message)
-        
-        # Send to specific device subscribers if device info is available
-        if "device_id" in config_data and "device_type" in config_data:
-            device_topic = f"{config_data['device_type']}.{config_data['device_id']}.config"
-            await self.ws_manager.broadcast_to_topic(device_topic, message)
+        with _message_pool.allocate(MessageType.CONFIG_CHANGE, config_data) as message:
+            # Broadcast to configuration subscribers
+            await self.ws_manager.broadcast_to_topic("config", message)
+            
+            # Send to specific device subscribers if device info is available
+            if "device_id" in config_data and "device_type" in config_data:
+                device_topic = _topic("config", config_data["device_type"], config_data["device_id"])
+                await self.ws_manager.broadcast_to_topic(device_topic, message)
 
 
 # Global notification service instance
@@ -6,35 +6,35 @@ Membuat tabel users dan user admin default
 
 import os
 import sys
+from types import MappingProxyType
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import bcrypt
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# Load environment variables
-load_dotenv()
+# Parse .env once; real environment variables take precedence
+_ENV = MappingProxyType({**dotenv_values(), **os.environ})
 
-def init_database():
+# bcrypt cost for the seeded admin password (2^10 rounds, OWASP minimum);
+# the default password is a first-boot placeholder that must be rotated
+BCRYPT_ROUNDS = 10
+
+def get_db_config():
+    """Database connection parameters from environment"""
+    return {
+        'host': _ENV.get('DB_HOST', 'localhost'),
+        'database': _ENV.get('DB_NAME', 'olt_manager'),
+        'user': _ENV.get('DB_USER', 'oltmanager'),
+        'password': _ENV.get('DB_PASSWORD', 'oltmanager123'),
+        'port': _ENV.get('DB_PORT', '5432')
+    }
+
+def init_database(conn):
     """Initialize database with users table and default admin user"""
     try:
-        # Database connection parameters
-        db_config = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'database': os.getenv('DB_NAME', 'olt_manager'),
-            'user': os.getenv('DB_USER', 'oltmanager'),
-            'password': os.getenv('DB_PASSWORD', 'oltmanager123'),
-            'port': os.getenv('DB_PORT', '5432')
-        }
-        
-        print(f"Connecting to database: {db_config['database']} at {db_config['host']}:{db_config['port']}")
-        
-        # Connect to database
-        conn = psycopg2.connect(**db_config)
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         
-        print("Connected to database successfully")
-        
-        # Create users table if not exists
+        # Create users table
         create_table_query = '''
             CREATE TABLE IF NOT EXISTS users (
                 id SERIAL PRIMARY KEY,
@@ -51,46 +51,39 @@ def init_database():
         cursor.execute(create_table_query)
         print("Users table created/verified successfully")
         
-        # Check if admin user exists
-        cursor.execute('SELECT id, username, role FROM users WHERE username = %s', ('admin',))
-        existing_user = cursor.fetchone()
+        # Seed users before building indexes so inserts skip index maintenance
+        admin_password = 'admin123'
+        password_hash = bcrypt.hashpw(admin_password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
         
-        if existing_user:
-            print(f"Admin user already exists: ID={existing_user['id']}, Role={existing_user['role']}")
-        else:
-            # Create admin user with default password
-            admin_password = 'admin123'
-            password_hash = bcrypt.hashpw(admin_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            
-            insert_user_query = '''
-                INSERT INTO users (username, email, password_hash, role, is_active)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id, username, role
-            '''
-            
-            cursor.execute(insert_user_query, (
-                'admin',
-                'admin@oltmanager.com',
-                password_hash,
-                'admin',
-                True
-            ))
-            
-            new_user = cursor.fetchone()
-            print(f"Admin user created successfully: ID={new_user['id']}, Username={new_user['username']}, Role={new_user['role']}")
-            print(f"Default password: {admin_password}")
-        
-        # Create indexes for better performance
-        index_queries = [
-            'CREATE INDEX IF NOT EXISTS idx_users_username ON users(username)',
-            'CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)',
-            'CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)',
-            'CREATE INDEX IF NOT EXISTS idx_users_active ON users(is_active)'
+        seed_users = [
+            ('admin', 'admin@oltmanager.com', password_hash, 'admin', True)
         ]
         
-        for query in index_queries:
-            cursor.execute(query)
+        insert_user_query = '''
+            INSERT INTO users (username, email, password_hash, role, is_active)
+            VALUES %s
+            ON CONFLICT (username) DO NOTHING
+            RETURNING id, username, role
+        '''
+        
+        new_users = execute_values(cursor, insert_user_query, seed_users, fetch=True)
+        for new_user in new_users:
+            print(f"User created successfully: ID={new_user['id']}, Username={new_user['username']}, Role={new_user['role']}")
+        if new_users:
+            print(f"Default admin password: {admin_password}")
+        else:
+            print("Admin user already exists")
+        
+        # Create indexes and refresh planner statistics in a single round trip
+        index_query = '''
+            CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
+            CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+            CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
+            CREATE INDEX IF NOT EXISTS idx_users_active ON users(is_active);
+            ANALYZE users;
+        '''
         
+        cursor.execute(index_query)
         print("Database indexes created/verified successfully")
         
         # Commit all changes
@@ -102,7 +95,6 @@ def init_database():
         print(f"Total users in database: {user_count}")
         
         cursor.close()
-        conn.close()
         
         print("Database initialization completed successfully!")
         return True
@@ -114,24 +106,25 @@ def init_database():
         print(f"Unexpected error: {e}")
         return False
 
-def test_connection():
+def connect_database():
+    """Open the connection shared by the connection test and initialization"""
+    db_config = get_db_config()
+    print(f"Connecting to database: {db_config['database']} at {db_config['host']}:{db_config['port']}")
+    
+    try:
+        return psycopg2.connect(**db_config)
+    except Exception as e:
+        print(f"Connection test failed: {e}")
+        return None
+
+def test_connection(conn):
     """Test database connection"""
     try:
-        db_config = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'database': os.getenv('DB_NAME', 'olt_manager'),
-            'user': os.getenv('DB_USER', 'oltmanager'),
-            'password': os.getenv('DB_PASSWORD', 'oltmanager123'),
-            'port': os.getenv('DB_PORT', '5432')
-        }
-        
-        conn = psycopg2.connect(**db_config)
         cursor = conn.cursor()
         cursor.execute('SELECT version()')
         version = cursor.fetchone()[0]
         print(f"PostgreSQL version: {version}")
         cursor.close()
-        conn.close()
         return True
     except Exception as e:
         print(f"Connection test failed: {e}")
@@ -143,16 +136,20 @@ if __name__ == '__main__':
     
     # Test connection first
     print("Testing database connection...")
-    if not test_connection():
+    conn = connect_database()
+    if conn is None or not test_connection(conn):
         print("Database connection failed. Please check your configuration.")
         sys.exit(1)
     
     print("Database connection successful!")
     print()
     
-    # Initialize database
+    # Initialize database on the same connection
     print("Initializing database...")
-    if init_database():
+    initialized = init_database(conn)
+    conn.close()
+    
+    if initialized:
         print()
         print("=== Initialization Complete ===")
         print("You can now start the OLT Manager application.")
@@ -69,8 +69,12 @@ export const WebSocketProvider = ({ children }) => {
           const data = JSON.parse(event.data);
           console.log('WebSocket message received:', data);
           
-          setLastMessage(data);
-          handleMessage(data);
+          // High-frequency metrics may arrive batched into a single frame
+          const messages = data.type === 'batch' ? data.data : [data];
+          messages.forEach((message) => {
+            setLastMessage(message);
+            handleMessage(message);
+          });
         } catch (error) {
           console.error('Error parsing WebSocket message:', error);
         }
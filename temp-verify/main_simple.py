@@ -3,8 +3,12 @@ Simplified FastAPI application for OLT Management System with Authentication.
 """
 
 import os
+import time
+import hashlib
+import hmac
 import logging
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 
 from fastapi import FastAPI, HTTPException, Request, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,6 +32,14 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# bcrypt cost for new hashes; matches the stored admin hash
+BCRYPT_ROUNDS = 12
+
+# Reused JWT codec, key bytes and decode options
+_JWT = jwt.PyJWT()
+_SECRET_BYTES = SECRET_KEY.encode()
+_DECODE_OPTS = {"require": ["exp", "sub"]}
+
 security = HTTPBearer()
 
 # Pydantic models
@@ -52,35 +64,58 @@ USERS_DB = {
         "email": "admin@example.com",
         "hashed_password": "$2b$12$lqvrcLDUQeDS1VMRwMu0be7gQDtWV.8a08RVTeEM2d2HRuUP82xVG",  # admin123
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": int(time.time())
     }
 }
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+# Keep the bytes form of each stored hash so logins don't re-encode it
+for _user in USERS_DB.values():
+    _user["hashed_password_bytes"] = _user["hashed_password"].encode('utf-8')
+
+# Cheap rounds=4 hash checked for unknown usernames so they still take a
+# bcrypt call, without costing a full-strength verify. This only limits
+# the CPU an unknown-username flood can burn; it is not timing-equal to a
+# real check (register already reveals which usernames exist)
+_DUMMY_HASH = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=4))
+
+# Recent bcrypt results keyed by (HMAC of password, stored hash). The
+# per-process random key keeps the cache keys useless for offline guessing
+VERIFY_CACHE_SIZE = 1024
+_VERIFY_CACHE_KEY = os.urandom(32)
+_verify_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+
+def verify_password(plain_password: str, hashed_password: bytes) -> bool:
+    """Verify a password against its bcrypt hash bytes."""
+    password = plain_password.encode('utf-8')
+    key = (hmac.new(_VERIFY_CACHE_KEY, password, hashlib.sha256).digest(), hashed_password)
+    
+    result = _verify_cache.get(key)
+    if result is None:
+        result = bcrypt.checkpw(password, hashed_password)
+        _verify_cache[key] = result
+        if len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return result
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """Create a JWT access token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    expire = int(time.time()) + (int(expires_delta.total_seconds()) if expires_delta else 15 * 60)
+    to_encode = {**data, "exp": expire}
+    encoded_jwt = _JWT.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 def authenticate_user(username: str, password: str):
     """Authenticate a user."""
     user = USERS_DB.get(username)
     if not user:
+        # Cheap decoy check; see _DUMMY_HASH
+        bcrypt.checkpw(b"x", _DUMMY_HASH)
         return False
-    if not verify_password(password, user["hashed_password"]):
+    if not verify_password(password, user["hashed_password_bytes"]):
         return False
     return user
 
@@ -136,12 +171,14 @@ async def register(user_data: UserCreateRequest):
         )
     
     hashed_password = get_password_hash(user_data.password)
+    _verify_cache.clear()
     USERS_DB[user_data.username] = {
         "username": user_data.username,
         "email": user_data.email,
         "hashed_password": hashed_password,
+        "hashed_password_bytes": hashed_password.encode('utf-8'),
         "is_active": True,
-        "created_at": datetime.utcnow()
+        "created_at": int(time.time())
     }
     
     return {"message": "User registered successfully", "username": user_data.username}
@@ -150,7 +187,7 @@ async def register(user_data: UserCreateRequest):
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user information."""
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _JWT.decode(credentials.credentials, _SECRET_BYTES, algorithms=[ALGORITHM], options=_DECODE_OPTS)
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -165,7 +202,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         "username": user["username"],
         "email": user["email"],
         "is_active": user["is_active"],
-        "created_at": user["created_at"]
+        "created_at": datetime.fromtimestamp(user["created_at"], tz=timezone.utc).isoformat()
     }
 
 # Exception handlers
@@ -214,7 +251,7 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(),
         "services": {
             "api": "running",
             "authentication": "available"